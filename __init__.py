@@ -3,10 +3,11 @@
 __author__ = 'Brian Burwell'
 __version__ = '1.0'
 
-from markdown import generate_markdown_table, convert_to_markdown_link
-from documentation import ( get_obj_documentation, get_public_methods, get_public_objects,
-                            get_subpackages, write_documentation_for_objs, write_package_documentation)
+from markdown import generate_markdown_table, convert_to_markdown_link, convert_to_markdown_links
+from documentation import ( check_package_documentation, get_obj_documentation, get_public_methods,
+                            get_public_objects, get_subpackages, write_documentation_for_objs,
+                            write_package_documentation)
                             
-__all__ = [ 'write_package_documentation', 'write_documentation_for_objs',
+__all__ = [ 'write_package_documentation', 'write_documentation_for_objs', 'check_package_documentation',
             'get_obj_documentation', 'get_public_methods', 'get_public_objects',
-            'generate_markdown_table', 'convert_to_markdown_link']
\ No newline at end of file
+            'generate_markdown_table', 'convert_to_markdown_link', 'convert_to_markdown_links']
\ No newline at end of file
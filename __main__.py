@@ -1,23 +1,16 @@
-from argparse import ArgumentParser
+import sys
 
-from documentation import write_package_documentation
+from daemon import forward_to_daemon
 
 
-__author__ = 'Brian Burwell'
-__version__ = '1.1'
+# forward to a warm daemon when one is running, so nothing else needs to be imported
+if sys.argv[1:2] not in (['serve'], ['daemon']):
+    response = forward_to_daemon(sys.argv[1:])
+    if response is not None:
+        sys.stdout.write(response['stdout'])
+        sys.stderr.write(response['stderr'])
+        sys.exit(response['status'])
 
-parser = ArgumentParser(prog='pydocumentation',
-                        description="A tool that automatically generates Markdown Documentation from Python docstrings.",
-                        usage="%(prog)s PATH..."
-                        )
+from cli import main
 
-parser.add_argument('-v', '--version', help='show the current version of %(prog)s',
-                    action='version', version=f'%(prog)s {__version__}')
-parser.add_argument('pkg', metavar='PATH', help='path to a Python package', nargs='+', type=str)
-
-args = parser.parse_args()
-
-if args.pkg is not None:
-    for pkg in args.pkg:
-        write_package_documentation(pkg)
-    print('\nDocumentation complete!')
+sys.exit(main(sys.argv[1:]))
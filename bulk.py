@@ -0,0 +1,285 @@
+"""bulk.py
+
+This module contains functions that write the documentation of many
+packages in one run, such as every repository in a directory or every
+package of a list of installed distributions.
+
+All of the packages are documented in the same process, so parsed
+docstrings, class member indexes, and imported dependencies are shared
+between them. Symbols are linked across packages in a single index and
+wherever a page mentions one by its full name.
+"""
+
+from glob import iglob
+from importlib.metadata import distribution
+from importlib.util import find_spec
+from os import listdir, makedirs
+from os.path import abspath, basename, exists, isdir, join, split
+import re
+import sys
+from time import perf_counter
+
+from documentation import read_page_timings, render_package_documentation, write_page_timings
+from markdown import sub_outside_code
+
+LINK_DEFINITION = re.compile(r'^\[([^\[\]\n]+)\]: #(\S*)$', re.MULTILINE)
+FULL_NAME = re.compile(r'(?<![\w.\[/#])(`?)([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+)\1(?!\w|\.\w|\(|\])')
+NOT_PACKAGES = ('docs', 'test', 'tests')
+
+
+def find_packages(repos_dir):
+    """Finds the top-level packages in a directory of repositories.
+
+    A repository is either a package itself or contains packages at its
+    root or in a `src` subdirectory. Private packages and test packages
+    are skipped.
+
+    Parameters
+    ----------
+    repos_dir : str or path-like
+        The path to a directory of repositories.
+
+    Returns
+    -------
+    list
+        The paths to every package directory, sorted by repository.
+    """
+
+    packages = []
+    for repo in sorted(listdir(repos_dir)):
+        repo_dir = join(repos_dir, repo)
+        if repo.startswith('.') or not isdir(repo_dir):
+            continue
+
+        if exists(join(repo_dir, '__init__.py')):
+            packages.append(repo_dir)
+            continue
+
+        for root in (repo_dir, join(repo_dir, 'src')):
+            for init_file in sorted(iglob(join(root, '*', '__init__.py'))):
+                package_dir = split(init_file)[0]
+                if not basename(package_dir).startswith('_') and basename(package_dir) not in NOT_PACKAGES:
+                    packages.append(package_dir)
+
+    return packages
+
+def find_distribution_packages(distributions):
+    """Finds the top-level packages of installed distributions.
+
+    Parameters
+    ----------
+    distributions : iterable of str
+        The names of installed distributions, as they are installed
+        with pip (ex: 'python-dateutil').
+
+    Returns
+    -------
+    list
+        The paths to every package directory.
+
+    Raises
+    ------
+    importlib.metadata.PackageNotFoundError
+        If one of the distributions is not installed.
+    """
+
+    packages = []
+    for name in distributions:
+        dist = distribution(name)
+
+        top_level = dist.read_text('top_level.txt')
+        if top_level is not None:
+            pkg_names = top_level.split()
+        else:
+            pkg_names = [file.parts[0] for file in dist.files or []
+                         if len(file.parts) == 2 and file.name == '__init__.py']
+
+        for pkg in dict.fromkeys(pkg_names):
+            if pkg.startswith('_'):
+                continue
+
+            # locate the installed files; importing by name could find a module of the same name
+            package_dir = abspath(dist.locate_file(pkg))
+            if exists(join(package_dir, '__init__.py')):
+                packages.append(package_dir)
+                continue
+
+            spec = find_spec(pkg) #ex: an editable install
+            if spec is not None and spec.submodule_search_locations:
+                packages.append(list(spec.submodule_search_locations)[0])
+
+    return packages
+
+def format_bulk_index(summaries, symbols):
+    """Formats the index page of a bulk documentation run.
+
+    Parameters
+    ----------
+    summaries : list
+        Tuples of the package name, the number of pages written, and the
+        seconds it took, or None for the pages and seconds if the
+        package failed.
+    symbols : dict
+        A dictionary where the key is the full name of a documented
+        object (ex: `pkg.subpkg.function`) and the value is the relative
+        link to its documentation.
+
+    Returns
+    -------
+    str
+        The index page as a markdown string.
+    """
+
+    index = '# Documentation Index\n\n## Packages\n'
+    index += '| Package | Pages | Seconds |\n| --- | --- | --- |\n'
+    for pkg, pages, seconds in summaries:
+        if pages is None:
+            index += f'| {pkg} | failed | |\n'
+        else:
+            index += f'| [{pkg}]({pkg}/{pkg}.md) | {pages} | {seconds:.3f} |\n'
+
+    index += '\n## Symbols\n'
+    for name in sorted(symbols, key=str.lower):
+        index += f'* [{name}]({symbols[name]})\n'
+
+    return index
+
+def link_symbols(documentation, symbols):
+    """Links the full names of documented objects mentioned in a page.
+
+    Names in code, headings, and the markdown link definitions at the
+    end of the page are not linked, except for an inline code span that
+    is only the name (ex: `pkg.Class`).
+
+    Parameters
+    ----------
+    documentation : str
+        A page of documentation written by a bulk documentation run.
+    symbols : dict
+        A dictionary where the key is the full name of a documented
+        object (ex: `pkg.subpkg.function`) and the value is its link
+        relative to the directory of the bulk documentation.
+
+    Returns
+    -------
+    str
+        The page with every mentioned symbol linked to its
+        documentation.
+    """
+
+    def link_symbol(match):
+        tick, name = match.groups()
+        if name not in symbols:
+            return match.group(0)
+        return f'[{tick}{name}{tick}](../{symbols[name]})'
+
+    content, separator, links = documentation.partition('<!-- Links -->\n')
+    return sub_outside_code(FULL_NAME, link_symbol, content, headings=False) + separator + links
+
+def write_bulk_documentation(package_dirs, output_dir, exclude=[], page_cache=None):
+    """Writes the documentation for many packages in a single run.
+
+    Every package gets its own subdirectory of `output_dir`, and an
+    `index.md` links to every package and every documented symbol across
+    all of the packages. Once every package is written, the full names
+    of documented objects mentioned in any page (ex: `pkg.Class` in a
+    parameter type) link to their documentation, even in another package.
+
+    Parameters
+    ----------
+    package_dirs : iterable of str or path-like
+        The paths to the main directory of every package.
+    output_dir : str or path-like
+        The directory to write the documentation to.
+    exclude : list, optional
+        A list of strings of subpackage names to not write documentation
+        for in any package. Default is None.
+    page_cache : PageCache, optional
+        A cache of rendered pages to reuse. Pages whose source files
+        have not changed are not rendered again. Default is None.
+
+    Returns
+    -------
+    list
+        The names of the packages that could not be documented. If every
+        package was documented, the list will be empty.
+    """
+
+    if not exists(output_dir):
+        makedirs(output_dir)
+
+    summaries = []
+    symbols = {}
+    failed = []
+    written = []
+
+    for package_dir in package_dirs:
+        package_dir = abspath(package_dir)
+        pkg = basename(package_dir)
+        if any(pkg == summary[0] for summary in summaries):
+            print(f'Skipping {package_dir}; a package named {pkg} was already documented')
+            continue
+
+        # packages in a directory of repositories are not installed, so make them importable,
+        # but after the standard library and installed packages so they are never shadowed
+        if split(package_dir)[0] not in sys.path:
+            sys.path.append(split(package_dir)[0])
+
+        spec = find_spec(pkg)
+        pkg_file = spec.origin if spec is not None and spec.has_location else None
+        if pkg_file is None or split(abspath(pkg_file))[0] != package_dir:
+            # ex: a package named like a module of pydocumentation or the standard library
+            print(f'Could not document {pkg}: importing {pkg} finds {pkg_file or "no package"} instead of {package_dir}')
+            summaries.append((pkg, None, None))
+            failed.append(pkg)
+            continue
+
+        docs_dir = join(output_dir, pkg)
+        if not exists(docs_dir):
+            makedirs(docs_dir)
+
+        timings = read_page_timings(docs_dir)
+        start = perf_counter()
+        pages = 0
+        try:
+            for page_pkg, doc_fname, documentation in render_package_documentation(package_dir, exclude=exclude,
+                                                                                 page_cache=page_cache, timings=timings):
+                page = basename(doc_fname)
+                with open(join(docs_dir, page), 'w') as f:
+                    f.write(documentation)
+                written.append(join(docs_dir, page))
+                pages += 1
+
+                for name, anchor in LINK_DEFINITION.findall(documentation.partition('<!-- Links -->\n')[2]):
+                    symbols.setdefault(f'{page_pkg}.{name}', f'{pkg}/{page}#{anchor}')
+        except Exception as e:
+            print(f'Could not document {pkg}: {type(e).__name__}: {e}')
+            summaries.append((pkg, None, None))
+            failed.append(pkg)
+            continue
+
+        write_page_timings(docs_dir, timings)
+
+        seconds = perf_counter() - start
+        summaries.append((pkg, pages, seconds))
+        print(f'Wrote {pages} pages for {pkg} in {seconds:.3f}s')
+
+    # every package has to be rendered before its symbols can be linked from the others
+    for page_fname in written:
+        with open(page_fname) as f:
+            documentation = f.read()
+        linked = link_symbols(documentation, symbols)
+        if linked != documentation:
+            with open(page_fname, 'w') as f:
+                f.write(linked)
+
+    with open(join(output_dir, 'index.md'), 'w') as f:
+        f.write(format_bulk_index(summaries, symbols))
+
+    documented = [summary for summary in summaries if summary[1] is not None]
+    print(f'\nDocumented {len(documented)} packages ({sum(s[1] for s in documented)} pages) '
+          f'in {sum(s[2] for s in documented):.3f}s')
+    for pkg, pages, seconds in sorted(documented, key=lambda s: s[2], reverse=True)[:10]:
+        print(f'  {pkg}: {pages} pages in {seconds:.3f}s')
+
+    return failed
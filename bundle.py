@@ -0,0 +1,167 @@
+"""bundle.py
+
+This module contains functions that write the documentation of a whole
+package as a single file, either one combined Markdown document or one
+archive of every page.
+"""
+
+from io import BytesIO
+from os.path import basename, split, splitext
+import re
+import tarfile
+from time import time
+import zipfile
+
+from documentation import get_page_index, render_package_documentation
+from markdown import get_heading_anchors, sub_outside_code
+
+ARCHIVE_MODES = {'.zip': None, '.tar': 'w', '.tar.gz': 'w:gz', '.tgz': 'w:gz', '.tar.bz2': 'w:bz2', '.tar.xz': 'w:xz'}
+LINK_DEFINITION = re.compile(r'^\[([^\[\]\n]+)\]: #(\S*)$', re.MULTILINE)
+LINK_REFERENCE = re.compile(r'\]\[([^\[\]\n]+)\]')
+PAGE_LINK = re.compile(r'\]\(([^()\s]+)\.md\)')
+
+
+def combine_page(documentation, page, pages, seen):
+    """Rewrites the links of a page so it can be part of a combined document.
+
+    Links to other pages become links to their anchors, reference link
+    labels defined by the page are prefixed with the page name so they
+    stay unique, and links to headings are renumbered for the headings
+    that come before the page. Code is never changed.
+
+    Parameters
+    ----------
+    documentation : str
+        The markdown documentation of the page.
+    page : str
+        The page filename, ex: `pkg-subpkg.md`.
+    pages : iterable of str
+        The filenames of every page in the combined document.
+    seen : dict
+        The number of times each markdown link has been used in the
+        combined document before this page. Updated in place.
+
+    Returns
+    -------
+    str
+        The documentation of the page, starting with its anchor.
+    """
+
+    name = splitext(page)[0]
+
+    local_anchors = get_heading_anchors(documentation)
+    combined_anchors = {}
+    for local_anchor, combined_anchor in zip(local_anchors, get_heading_anchors(documentation, seen)):
+        combined_anchors.setdefault(local_anchor, combined_anchor)
+
+    def page_link(match):
+        if f'{match.group(1)}.md' in pages:
+            return f'](#{match.group(1)})'
+        return match.group(0)
+
+    def link_definition(match):
+        anchor = combined_anchors.get(match.group(2), match.group(2))
+        return f'[{name}/{match.group(1)}]: #{anchor}'
+
+    content, _, links = documentation.partition('<!-- Links -->\n')
+    labels = {label for label, _ in LINK_DEFINITION.findall(links)}
+
+    def link_reference(match):
+        if match.group(1) in labels:
+            return f'][{name}/{match.group(1)}]'
+        return match.group(0)
+
+    content = sub_outside_code(PAGE_LINK, page_link, content)
+    content = sub_outside_code(LINK_REFERENCE, link_reference, content)
+    links = LINK_DEFINITION.sub(link_definition, links)
+
+    return f'<a name="{name}"></a>\n\n{content}<!-- Links -->\n{links}\n'
+
+def get_archive_mode(bundle_fname):
+    """Gets the archive format of a bundle from its filename.
+
+    Parameters
+    ----------
+    bundle_fname : str or path-like
+        The filename of the bundle.
+
+    Returns
+    -------
+    str or None
+        The extension of the archive format, or None if the bundle is a
+        combined markdown document.
+
+    Raises
+    ------
+    ValueError
+        If the extension is not '.md' or a supported archive format.
+    """
+
+    bundle_fname = str(bundle_fname)
+    if bundle_fname.endswith('.md'):
+        return None
+    for extension in sorted(ARCHIVE_MODES, key=len, reverse=True):
+        if bundle_fname.endswith(extension):
+            return extension
+
+    raise ValueError(f"Unsupported bundle format for {bundle_fname}; use '.md' or one of {', '.join(ARCHIVE_MODES)}")
+
+def write_package_bundle(bundle_fname, package_dir='', exclude=[], page_cache=None):
+    """Writes the documentation for a package and its subpackages as one file.
+
+    A bundle ending in '.md' is one combined markdown document where the
+    navbar and table of contents links point to anchors in the same
+    document. A bundle ending in '.zip' or a tar extension (ex:
+    '.tar.gz') is an archive with one file per page. Pages are written
+    to the bundle one at a time as soon as they are rendered.
+
+    Parameters
+    ----------
+    bundle_fname : str or path-like
+        The filename of the bundle.
+    package_dir : str or path-like, optional
+        The path to the main package directory. If not given, will
+        default to the directory that `documentation.py` is in. Default
+        is None.
+    exclude : list, optional
+        A list of strings of subpackage names to not write
+        documentation for. Default is None.
+    page_cache : PageCache, optional
+        A cache of rendered pages to reuse. Pages whose source files
+        have not changed are not rendered again. Default is None.
+    """
+
+    if package_dir == '':
+        package_dir = split(__file__)[0]
+
+    archive_mode = get_archive_mode(bundle_fname)
+    pages = get_page_index(package_dir, exclude=exclude)
+
+    if archive_mode is None:
+        bundle = open(bundle_fname, 'w')
+        seen = {}
+
+        def write_page(doc_fname, documentation):
+            bundle.write(combine_page(documentation, basename(doc_fname), pages, seen))
+
+    elif archive_mode == '.zip':
+        bundle = zipfile.ZipFile(bundle_fname, 'w', zipfile.ZIP_DEFLATED)
+
+        def write_page(doc_fname, documentation):
+            bundle.writestr(basename(doc_fname), documentation)
+
+    else:
+        bundle = tarfile.open(bundle_fname, ARCHIVE_MODES[archive_mode])
+
+        def write_page(doc_fname, documentation):
+            data = documentation.encode()
+            info = tarfile.TarInfo(basename(doc_fname))
+            info.size = len(data)
+            info.mtime = time()
+            bundle.addfile(info, BytesIO(data))
+
+    with bundle:
+        for pkg, doc_fname, documentation in render_package_documentation(package_dir, exclude=exclude,
+                                                                        page_cache=page_cache):
+            print(f'Bundling documentation for {pkg} ...')
+            write_page(doc_fname, documentation)
@@ -0,0 +1,332 @@
+"""cache.py
+
+This module contains an in-memory cache of rendered documentation pages
+that is invalidated per page when its source files change.
+"""
+
+from collections import OrderedDict
+from glob import iglob
+from inspect import getmodule, getmro, isclass, isfunction, ismodule
+from os.path import abspath, exists, getmtime, join
+import sys
+from sysconfig import get_paths
+
+from documentation import get_public_objects, render_package_page
+
+
+def get_loaded_modules(package_dir):
+    """Gets the source files of every loaded module in a package tree.
+
+    Parameters
+    ----------
+    package_dir : str or path-like
+        The path to the package directory.
+
+    Returns
+    -------
+    list
+        The absolute paths to the source file of every module in
+        `sys.modules` that is inside `package_dir` or its subdirectories.
+    """
+
+    package_root = join(abspath(package_dir), '')
+    return [abspath(module.__file__) for module in list(sys.modules.values())
+            if getattr(module, '__file__', None) and abspath(module.__file__).startswith(package_root)]
+
+def get_page_sources(package_dir, package_name):
+    """Gets the source files that a rendered documentation page depends on.
+
+    These are the modules that define every public object of the package
+    (and the bases of its classes), including objects re-exported from
+    deeper modules or other packages, and every loaded module in the
+    package tree.
+
+    Parameters
+    ----------
+    package_dir : str or path-like
+        The path to the package directory.
+    package_name : str
+        The full name of the package as it is imported.
+
+    Returns
+    -------
+    set
+        The absolute paths to the source files.
+    """
+
+    sources = set(get_loaded_modules(package_dir))
+    for obj in get_public_objects(package_name):
+        for defining_obj in getmro(obj) if isclass(obj) else (obj,):
+            module_file = getattr(getmodule(defining_obj), '__file__', None)
+            if module_file:
+                sources.add(abspath(module_file))
+
+    return sources
+
+def get_mtime(source):
+    """Gets the modification time of a source file.
+
+    Parameters
+    ----------
+    source : str or path-like
+        The path to the source file.
+
+    Returns
+    -------
+    float or None
+        The modification time, or None if the file no longer exists.
+    """
+
+    return getmtime(source) if exists(source) else None
+
+def get_source_mtimes(package_dir):
+    """Gets the modification time of every source file in a package tree.
+
+    Parameters
+    ----------
+    package_dir : str or path-like
+        The path to the package directory.
+
+    Returns
+    -------
+    dict
+        The modification time of each source file, where the key is its
+        absolute path.
+    """
+
+    return {abspath(source): get_mtime(source) for source in iglob(join(package_dir, '**', '*.py'), recursive=True)}
+
+def find_changed_sources(sources, loaded_mtimes):
+    """Finds the source files that have changed since they were loaded.
+
+    Parameters
+    ----------
+    sources : iterable of str
+        The absolute paths to the source files to check.
+    loaded_mtimes : dict
+        The modification time of each source file when it was last
+        loaded. Updated in place.
+
+    Returns
+    -------
+    set
+        The absolute paths to the changed source files.
+    """
+
+    changed = set()
+    for source in sources:
+        mtime = get_mtime(source)
+        if source in loaded_mtimes and loaded_mtimes[source] != mtime:
+            changed.add(source)
+        loaded_mtimes[source] = mtime
+
+    return changed
+
+def imports_from(module, package_names):
+    """Checks if a module holds modules or objects from certain packages.
+
+    Parameters
+    ----------
+    module : module
+        The module to check.
+    package_names : set
+        The names of top-level packages.
+
+    Returns
+    -------
+    bool
+        Whether a global of `module` is one of the packages' modules or
+        a class or function defined in them.
+    """
+
+    for value in list(vars(module).values()):
+        if ismodule(value):
+            name = value.__name__
+        elif isclass(value) or isfunction(value):
+            name = value.__module__ or ''
+        else:
+            continue
+        if name.split('.')[0] in package_names:
+            return True
+
+    return False
+
+def unload_packages(package_names):
+    """Unloads packages so that they are imported again fresh.
+
+    Every loaded package that imports from one of them is unloaded as
+    well, since it would keep the old objects. The next import then
+    loads every module again in dependency order.
+
+    Parameters
+    ----------
+    package_names : iterable of str
+        The names of top-level packages.
+    """
+
+    package_names = set(package_names)
+    while True:
+        dependents = {name.split('.')[0] for name, module in list(sys.modules.items())
+                      if name.split('.')[0] not in package_names and name != '__main__'
+                      and getattr(module, '__file__', None) and imports_from(module, package_names)}
+        if not dependents:
+            break
+        package_names |= dependents
+
+    for name in list(sys.modules):
+        if name.split('.')[0] in package_names and name != '__main__':
+            del sys.modules[name]
+
+def unload_changed_packages(sources, loaded_mtimes):
+    """Unloads every package with a module whose source file has changed.
+
+    A module cannot be reloaded on its own: the modules that imported
+    from it would keep its old objects. The whole top-level package and
+    every package that imports from it are unloaded instead.
+
+    Parameters
+    ----------
+    sources : iterable of str
+        The absolute paths to the source files to check.
+    loaded_mtimes : dict
+        The modification time of each source file when it was last
+        loaded. Updated in place.
+
+    Returns
+    -------
+    bool
+        Whether any source file had changed.
+    """
+
+    changed = find_changed_sources(sources, loaded_mtimes)
+    if changed:
+        unload_packages({name.split('.')[0] for name, module in list(sys.modules.items())
+                         if getattr(module, '__file__', None) and abspath(module.__file__) in changed})
+
+    return bool(changed)
+
+class PageCache():
+    """A bounded in-memory cache of rendered documentation pages.
+
+    A page is only rendered when it is requested and stays cached until
+    one of the modules it depends on changes or it is evicted as the least
+    recently used page.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of pages kept in the cache.
+    renders : int
+        The number of pages that have been rendered rather than taken
+        from the cache.
+
+    Methods
+    -------
+    get(package_dir, parent_package=None, include_subpkg_toc=True, exclude=[])
+        Gets a rendered page, rendering it only if needed.
+    remember_loaded_modules(mtimes={})
+        Remembers when newly imported modules were loaded.
+    unload_changed_modules()
+        Unloads the packages of every remembered module that has changed.
+    """
+
+    def __init__(self, maxsize=128):
+        """Creates an empty page cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of pages kept in the cache. Default is 128.
+        """
+
+        self.maxsize = maxsize
+        self.renders = 0
+        self._pages = OrderedDict()
+        self._loaded_mtimes = {}
+
+    def get(self, package_dir, parent_package=None, include_subpkg_toc=True, exclude=[]):
+        """Gets a rendered page, rendering it only if needed.
+
+        Parameters
+        ----------
+        package_dir : str or path-like
+            The path to the package directory.
+        parent_package : str, optional
+            If the package in `package_dir` is a subdirectory, the name
+            of the main package it is part of. Default is None.
+        include_subpkg_toc : bool, optional
+            Whether or not to include a table of contents of
+            subpackages. Default is True.
+        exclude : list, optional
+            A list of strings of subpackage names to not add to the
+            table of contents. Default is None.
+
+        Returns
+        -------
+        str
+            The full name of the package.
+        str
+            The filename the page belongs at.
+        str
+            The documentation of the page as a markdown string.
+        """
+
+        key = (abspath(package_dir), parent_package, include_subpkg_toc, tuple(exclude))
+
+        stale_sources = []
+        if key in self._pages:
+            sources, page = self._pages[key]
+            if all(get_mtime(source) == mtime for source, mtime in sources.items()):
+                self._pages.move_to_end(key)
+                return page
+            stale_sources = list(sources)
+        # packages that import from a changed module are unloaded too, so the page renders from fresh objects
+        unload_changed_packages(stale_sources + get_loaded_modules(package_dir), self._loaded_mtimes)
+
+        # a file saved while rendering must leave the page stale, so take its time before importing it
+        mtimes = get_source_mtimes(package_dir)
+        page = render_package_page(package_dir, parent_package, include_subpkg_toc, exclude)
+        self.renders += 1
+        self.remember_loaded_modules(mtimes)
+
+        sources = {source: self._loaded_mtimes.get(source, get_mtime(source))
+                   for source in get_page_sources(package_dir, page[0])}
+        self._pages[key] = (sources, page)
+        self._pages.move_to_end(key)
+        if len(self._pages) > self.maxsize:
+            self._pages.popitem(last=False)
+
+        return page
+
+    def remember_loaded_modules(self, mtimes={}):
+        """Remembers when newly imported modules were loaded.
+
+        Later edits to these modules will make their packages unload.
+        The standard library is not remembered.
+
+        Parameters
+        ----------
+        mtimes : dict, optional
+            The modification times of source files taken before they
+            were imported, where the key is the absolute path. Files
+            that are not in it use their current modification time.
+            Default is None.
+        """
+
+        stdlib = tuple(join(abspath(get_paths()[path]), '') for path in ('stdlib', 'platstdlib'))
+        for module in list(sys.modules.values()):
+            module_file = getattr(module, '__file__', None)
+            if not module_file or not exists(module_file):
+                continue
+            module_file = abspath(module_file)
+            if module_file not in self._loaded_mtimes and not module_file.startswith(stdlib):
+                self._loaded_mtimes[module_file] = mtimes.get(module_file, getmtime(module_file))
+
+    def unload_changed_modules(self):
+        """Unloads the packages of every remembered module that has changed.
+
+        The packages are imported again fresh the next time they are
+        used, ex: before rendering the pages of a run.
+        """
+
+        unload_changed_packages(list(self._loaded_mtimes), self._loaded_mtimes)
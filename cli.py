@@ -0,0 +1,161 @@
+"""cli.py
+
+This module contains the command line interface of pydocumentation.
+"""
+
+from argparse import ArgumentParser
+from os.path import abspath, basename
+
+from documentation import check_package_documentation, write_package_documentation
+
+
+__author__ = 'Brian Burwell'
+__version__ = '1.1'
+
+parser = ArgumentParser(prog='pydocumentation',
+                        description="A tool that automatically generates Markdown Documentation from Python docstrings.",
+                        usage="%(prog)s [--check [--fail-fast] | --timings] PATH...\n"
+                              "       %(prog)s --bundle FILE PATH\n"
+                              "       %(prog)s bulk [--output DIR] [--dist NAME] [REPOS...]\n"
+                              "       %(prog)s serve [--host HOST] [--port PORT] PATH\n"
+                              "       %(prog)s daemon [--socket SOCKET] [--stop]",
+                        epilog="run '%(prog)s bulk --help', '%(prog)s serve --help' or '%(prog)s daemon --help' for the other commands"
+                        )
+
+parser.add_argument('-v', '--version', help='show the current version of %(prog)s',
+                    action='version', version=f'%(prog)s {__version__}')
+parser.add_argument('--check', help='verify that the written documentation is current without writing anything',
+                    action='store_true')
+parser.add_argument('--fail-fast', help='with --check, stop at the first stale or missing page',
+                    action='store_true')
+parser.add_argument('--timings', help='report the predicted versus actual time of the most expensive pages',
+                    action='store_true')
+parser.add_argument('--bundle', metavar='FILE', help="write all of the documentation to one combined '.md' document "
+                                                     "or one '.zip'/'.tar.gz' archive instead of the /docs directory")
+parser.add_argument('pkg', metavar='PATH', help='path to a Python package', nargs='+', type=str)
+
+bulk_parser = ArgumentParser(prog='pydocumentation bulk',
+                             description="Document every package in directories of repositories or in installed "
+                                         "distributions in one run, with an index that links symbols across packages.")
+bulk_parser.add_argument('--output', help='the directory to write the documentation to (default: %(default)s)',
+                         default='docs')
+bulk_parser.add_argument('--dist', metavar='NAME', help='an installed distribution to document; can be repeated',
+                         action='append', default=[])
+bulk_parser.add_argument('repos', metavar='REPOS', help='path to a directory of repositories', nargs='*', type=str)
+
+serve_parser = ArgumentParser(prog='pydocumentation serve',
+                              description="Preview documentation from a local server that renders pages on demand.")
+serve_parser.add_argument('--host', help='the address to listen on (default: %(default)s)', default='localhost')
+serve_parser.add_argument('--port', help='the port to listen on (default: %(default)s)', default=8000, type=int)
+serve_parser.add_argument('--cache-size', help='the maximum number of rendered pages kept in memory (default: %(default)s)',
+                          default=128, type=int)
+serve_parser.add_argument('pkg', metavar='PATH', help='path to a Python package', type=str)
+
+daemon_parser = ArgumentParser(prog='pydocumentation daemon',
+                               description="Run a background daemon that keeps packages imported and pages cached "
+                                           "so that later runs of pydocumentation skip the cold start.")
+daemon_parser.add_argument('--socket', help='the Unix socket to listen on (default: %(default)s)', default=None)
+daemon_parser.add_argument('--cache-size', help='the maximum number of rendered pages kept in memory (default: %(default)s)',
+                           default=1024, type=int)
+daemon_parser.add_argument('--stop', help='stop the running daemon', action='store_true')
+
+
+def main(argv, page_cache=None):
+    """Runs pydocumentation with command line arguments.
+
+    Parameters
+    ----------
+    argv : list
+        The command line arguments, not including the program name.
+    page_cache : PageCache, optional
+        A cache of rendered pages to reuse between runs. Default is None.
+
+    Returns
+    -------
+    int
+        The exit status of the command.
+    """
+
+    if argv[:1] == ['bulk']:
+        from importlib.metadata import PackageNotFoundError
+
+        from bulk import find_distribution_packages, find_packages, write_bulk_documentation
+
+        bulk_args = bulk_parser.parse_args(argv[1:])
+        package_dirs = [package_dir for repos_dir in bulk_args.repos for package_dir in find_packages(repos_dir)]
+        try:
+            package_dirs += find_distribution_packages(bulk_args.dist)
+        except PackageNotFoundError as e:
+            bulk_parser.error(str(e))
+        if not package_dirs:
+            bulk_parser.error('no packages were found')
+
+        failed = write_bulk_documentation(package_dirs, bulk_args.output, page_cache=page_cache)
+        return 1 if failed else 0
+
+    if argv[:1] == ['serve']:
+        from server import serve_package_documentation
+
+        serve_args = serve_parser.parse_args(argv[1:])
+        serve_package_documentation(serve_args.pkg, serve_args.host, serve_args.port, serve_args.cache_size)
+        return 0
+
+    if argv[:1] == ['daemon']:
+        from daemon import run_daemon, stop_daemon
+
+        daemon_args = daemon_parser.parse_args(argv[1:])
+        if daemon_args.stop:
+            return stop_daemon(daemon_args.socket)
+        return run_daemon(daemon_args.socket, daemon_args.cache_size)
+
+    args = parser.parse_args(argv)
+    if args.fail_fast and not args.check:
+        parser.error('--fail-fast is only valid with --check')
+
+    if args.bundle is not None:
+        from bundle import get_archive_mode, write_package_bundle
+
+        if args.check or args.timings:
+            parser.error('--bundle cannot be combined with --check, --fail-fast or --timings')
+        if len(args.pkg) > 1:
+            parser.error('--bundle takes a single PATH')
+        try:
+            get_archive_mode(args.bundle)
+        except ValueError as e:
+            parser.error(str(e))
+
+        write_package_bundle(args.bundle, args.pkg[0], page_cache=page_cache)
+        print(f'\nDocumentation bundled in {args.bundle}')
+    elif args.check:
+        # a check must not trust cached pages or imports; the checked packages are always imported fresh
+        mtimes = {}
+        if page_cache is not None:
+            from cache import get_source_mtimes, unload_packages
+
+            page_cache.unload_changed_modules()
+            unload_packages(basename(abspath(pkg)) for pkg in args.pkg)
+            for pkg in args.pkg:
+                mtimes.update(get_source_mtimes(pkg))
+
+        stale = []
+        try:
+            for pkg in args.pkg:
+                stale += check_package_documentation(pkg, fail_fast=args.fail_fast)
+                if args.fail_fast and stale:
+                    break
+        finally:
+            if page_cache is not None:
+                page_cache.remember_loaded_modules(mtimes)
+
+        if stale:
+            print('Documentation is out of date:')
+            for doc_fname in stale:
+                print(f'  {doc_fname}')
+            return 1
+        print('Documentation is current.')
+    else:
+        for pkg in args.pkg:
+            write_package_documentation(pkg, page_cache=page_cache, timing_report=args.timings)
+        print('\nDocumentation complete!')
+
+    return 0
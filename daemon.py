@@ -0,0 +1,263 @@
+"""daemon.py
+
+This module contains a background daemon that keeps target packages
+imported and rendered pages cached between runs of pydocumentation, and
+the client that forwards command line arguments to it.
+
+The client only uses lightweight built-in modules so that a run that is
+forwarded to the daemon skips importing the rest of pydocumentation.
+"""
+
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+import json
+import os
+from os.path import dirname, exists, join
+import socket
+import stat
+import struct
+import sys
+from tempfile import gettempdir
+
+# seconds to connect and send a request, or for the daemon to read one
+REQUEST_TIMEOUT = 5
+# seconds to wait for the daemon to finish a command before running it locally
+RESPONSE_TIMEOUT = 300
+
+
+def get_socket_path(socket_path=None):
+    """Gets the path to the Unix socket the daemon listens on.
+
+    Parameters
+    ----------
+    socket_path : str or path-like, optional
+        An explicit path to the socket. If not given, will default to
+        the `PYDOCUMENTATION_SOCKET` environment variable or a file in
+        a private per-user directory of the temporary directory. Default
+        is None.
+
+    Returns
+    -------
+    str
+        The path to the Unix socket.
+    """
+
+    if socket_path is not None:
+        return socket_path
+    if 'PYDOCUMENTATION_SOCKET' in os.environ:
+        return os.environ['PYDOCUMENTATION_SOCKET']
+    return join(gettempdir(), f'pydocumentation-{os.getuid()}', 'daemon.sock')
+
+def get_import_path():
+    """Gets the import path of this process.
+
+    Returns
+    -------
+    list
+        The absolute paths in `sys.path`.
+    """
+
+    return [os.path.abspath(path) for path in sys.path]
+
+def send_request(request, socket_path=None):
+    """Sends a request to the daemon and waits for its response.
+
+    Parameters
+    ----------
+    request : dict
+        The request to send, which must be serializable as JSON.
+    socket_path : str or path-like, optional
+        The path to the daemon's Unix socket. Default is None.
+
+    Returns
+    -------
+    dict or None
+        The response of the daemon, or None if no daemon of this user is
+        listening or it does not respond in time.
+    """
+
+    socket_path = get_socket_path(socket_path)
+    if not hasattr(socket, 'AF_UNIX') or not exists(socket_path):
+        return None
+    # only trust a daemon run by this user
+    if os.stat(socket_path).st_uid != os.getuid():
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        response = b''
+        try:
+            client.settimeout(REQUEST_TIMEOUT)
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode() + b'\n')
+            client.shutdown(socket.SHUT_WR)
+
+            client.settimeout(RESPONSE_TIMEOUT)
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                response += chunk
+        except OSError:
+            return None
+
+    try:
+        return json.loads(response) if response else None
+    except ValueError:
+        return None
+
+def forward_to_daemon(argv, socket_path=None):
+    """Forwards command line arguments to a running daemon.
+
+    Parameters
+    ----------
+    argv : list
+        The command line arguments, not including the program name.
+    socket_path : str or path-like, optional
+        The path to the daemon's Unix socket. Default is None.
+
+    Returns
+    -------
+    dict or None
+        The exit `status` and the captured `stdout` and `stderr` of the
+        command, or None if no daemon is listening or it runs a different
+        interpreter or import path than this process.
+    """
+
+    response = send_request({'argv': argv, 'cwd': os.getcwd(), 'executable': sys.executable, 'path': get_import_path()},
+                            socket_path)
+    if response is None or response.get('mismatch'):
+        return None
+    return response
+
+def stop_daemon(socket_path=None):
+    """Stops a running daemon.
+
+    Parameters
+    ----------
+    socket_path : str or path-like, optional
+        The path to the daemon's Unix socket. Default is None.
+
+    Returns
+    -------
+    int
+        The exit status; 1 if no daemon was running.
+    """
+
+    if send_request({'stop': True}, socket_path) is None:
+        print('No pydocumentation daemon is running.')
+        return 1
+    print('Stopped the pydocumentation daemon.')
+    return 0
+
+def run_daemon(socket_path=None, cache_size=1024):
+    """Runs the daemon in the foreground until it is stopped.
+
+    Target packages stay imported and rendered pages stay cached between
+    requests. Only the user running the daemon can connect to it. Only the packages whose source files have changed, and the
+    packages that import from them, are imported again.
+
+    Parameters
+    ----------
+    socket_path : str or path-like, optional
+        The path to the Unix socket to listen on. Default is None.
+    cache_size : int, optional
+        The maximum number of rendered pages kept in memory. Default is
+        1024.
+
+    Returns
+    -------
+    int
+        The exit status; 1 if a daemon is already running or the
+        socket's directory belongs to another user.
+    """
+
+    from socketserver import StreamRequestHandler, UnixStreamServer
+
+    from cache import PageCache
+    from cli import main
+
+    socket_path = get_socket_path(socket_path)
+    if send_request({'ping': True}, socket_path) is not None:
+        print(f'A pydocumentation daemon is already listening on {socket_path}')
+        return 1
+
+    socket_dir = dirname(socket_path) or '.'
+    if socket_path == get_socket_path():
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        # the default directory has a predictable name in a shared directory; it has to be ours alone
+        dir_stat = os.lstat(socket_dir)
+        if not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+            print(f'{socket_dir} must be a directory that only you can access')
+            return 1
+    if exists(socket_path):
+        os.remove(socket_path)
+
+    page_cache = PageCache(cache_size)
+    # bulk runs append repositories to sys.path, so compare clients with the path the daemon started with
+    import_path = get_import_path()
+
+    class DaemonRequestHandler(StreamRequestHandler):
+        timeout = REQUEST_TIMEOUT
+
+        def handle(self):
+            if hasattr(socket, 'SO_PEERCRED'):
+                uid = struct.unpack('3i', self.request.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                                                  struct.calcsize('3i')))[1]
+                if uid != os.getuid():
+                    return
+            try:
+                request = json.loads(self.rfile.readline())
+            except (OSError, ValueError):
+                return
+            # commands can take much longer than reading the request
+            self.request.settimeout(None)
+
+            if request.get('stop'):
+                self.server.stopped = True
+                response = {}
+            elif request.get('ping'):
+                response = {}
+            elif request['executable'] != sys.executable or request['path'] != import_path:
+                # the client would import different packages; it has to run on its own
+                response = {'mismatch': True}
+            else:
+                stdout, stderr = StringIO(), StringIO()
+                cwd = os.getcwd()
+                try:
+                    os.chdir(request['cwd'])
+                    with redirect_stdout(stdout), redirect_stderr(stderr):
+                        status = main(request['argv'], page_cache)
+                except SystemExit as e:
+                    status = e.code if isinstance(e.code, int) else 1
+                except Exception as e:
+                    stderr.write(f'{type(e).__name__}: {e}\n')
+                    status = 1
+                finally:
+                    os.chdir(cwd)
+                response = {'status': status, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+            try:
+                self.wfile.write(json.dumps(response).encode())
+            except OSError:
+                pass #the client stopped waiting and runs the command on its own
+
+    # create the socket so that only this user can connect to it
+    umask = os.umask(0o077)
+    try:
+        server = UnixStreamServer(socket_path, DaemonRequestHandler)
+    finally:
+        os.umask(umask)
+    os.chmod(socket_path, 0o600)
+
+    with server:
+        server.stopped = False
+        print(f'pydocumentation daemon listening on {socket_path}')
+        try:
+            while not server.stopped:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+
+    return 0
@@ -1,15 +1,21 @@
-from functools import partial
+from functools import lru_cache, partial
 from glob import iglob
+from hashlib import sha256
 from importlib import import_module
 from inspect import (getattr_static, getmodule, getmro,
                     isbuiltin, isclass, isfunction, ismethod, signature)
 from itertools import islice
-from os.path import abspath, basename, exists, expanduser, join, sep, split
+import json
+from os.path import abspath, basename, exists, expanduser, join, normpath, sep, split
 from os import makedirs
 from shutil import copyfile
+import sys
+from time import perf_counter
 
 
-from markdown import convert_to_markdown_link, generate_markdown_table
+from markdown import generate_markdown_table, link_headings
+
+TIMINGS_FILENAME = '.pydocumentation-timings.json'
 
 # https://stackoverflow.com/questions/3589311/get-defining-class-of-unbound-method-object-in-python-3
 def get_class_that_defined_method(meth):
@@ -69,7 +75,30 @@ def get_public_methods(class_obj):
         All of the objects that represent public methods of `class_obj`.
     """
 
-    return [getattr_static(class_obj,m) for m in dir(class_obj) if not m.startswith('_')]
+    try:
+        return list(index_public_methods(class_obj))
+    except TypeError:  # classes with an unhashable metaclass can't be cached
+        return [getattr_static(class_obj,m) for m in dir(class_obj) if not m.startswith('_')]
+
+@lru_cache(maxsize=1024)
+def index_public_methods(class_obj):
+    """Indexes all of the "public" methods of a class.
+
+    Results are cached per class, so base classes shared by many
+    classes or packages are only indexed once per process.
+
+    Parameters
+    ----------
+    class_obj : obj
+        A Python class.
+
+    Returns
+    -------
+    tuple
+        All of the objects that represent public methods of `class_obj`.
+    """
+
+    return tuple(getattr_static(class_obj,m) for m in dir(class_obj) if not m.startswith('_'))
 
 def get_public_objects(package):
     """Gets all of the "public" objects of a package.
@@ -120,8 +149,31 @@ def get_obj_documentation(obj):
         string for a markdown link that will link back to its documentation.
     """
 
+    md_docstring, titles = get_obj_markdown(obj)
+    return md_docstring, link_headings(md_docstring, titles)
+
+def get_obj_markdown(obj):
+    """Gets the documentation of an object and the headings to link to.
+
+    Parameters
+    ----------
+    obj : object
+        The Python object to format a documentation markdown string.
+        Should have a `__doc__` property.
+
+    Returns
+    -------
+    str
+        The documentation of the object as a string formatted for
+        markdown.
+    list
+        Tuples of the name of the function or class and of every class
+        method and the text of its heading, in the order they appear in
+        the documentation.
+    """
+
     md_docstring = ''
-    links = {}
+    titles = []
 
     #functions and methods
     if isfunction(obj):
@@ -144,7 +196,7 @@ def get_obj_documentation(obj):
             name = f'{cls.__name__}.{obj.__name__}'
             title = f'### {cls.__name__}.**{obj.__name__}**({param_str})\n'
             
-        links[name] = convert_to_markdown_link(title)[1:]
+        titles.append((name, title.lstrip('#').strip()))
         md_docstring += title
 
         docstring = parse_docstring(obj)
@@ -174,7 +226,7 @@ def get_obj_documentation(obj):
     elif isclass(obj):
             title = f'### *class* {obj.__name__}\n'
 
-            links[obj.__name__] = convert_to_markdown_link(title)[1:]
+            titles.append((obj.__name__, title.lstrip('#').strip()))
             md_docstring += title
 
             class_docstring = parse_docstring(obj)
@@ -217,11 +269,11 @@ def get_obj_documentation(obj):
             md_docstring += '---\n\n'
 
             for method in get_public_methods(obj):
-                method_doc, method_links = get_obj_documentation(method)
+                method_doc, method_titles = get_obj_markdown(method)
                 md_docstring += method_doc
-                links.update(method_links)
+                titles += method_titles
 
-    return md_docstring, links
+    return md_docstring, titles
 
 def get_subpackages(package_dir, include_nested=False):
     """Gets all of the subpackages contained within a package.
@@ -301,17 +353,53 @@ def get_subpackage_toc(package_dir, package_name='', exclude=[]):
 
     return subpackage_toc
 
-def parse_docstring(obj):
-    """Parses the sections of a numpy-style docstring.
+def get_page_index(package_dir, parent_package=None, exclude=[]):
+    """Maps every documentation page of a package to the package it documents.
 
-    For more on writing numpy-style docstrings read their documentation
-    at https://numpydoc.readthedocs.io/en/latest/format.html
+    Only the directory tree is scanned; nothing is imported or rendered.
 
     Parameters
     ----------
-    obj : Python object
-        An object, such as a method or a class, that has a docstring in
-        numpy-style.
+    package_dir : str or path-like
+        The path to the main package directory.
+    parent_package : str, optional
+        If the package in `package_dir` is a subdirectory, the name of
+        the main package it is part of. Default is None.
+    exclude : list, optional
+        A list of strings of subpackage names to leave out of the index.
+        Default is None.
+
+    Returns
+    -------
+    dict
+        A dictionary where the key is the page filename (ex:
+        `pkg-subpkg.md`) and the value is a tuple of the package
+        directory and its parent package name.
+    """
+
+    pkg = basename(abspath(package_dir))
+    if parent_package is not None:
+        pkg = f'{parent_package}.{pkg}'
+
+    index = {f"{pkg.replace('.','-')}.md": (package_dir, parent_package)}
+    for subpkg in get_subpackages(package_dir):
+        if subpkg not in exclude:
+            index.update(get_page_index(join(package_dir, subpkg), pkg, exclude))
+
+    return index
+
+@lru_cache(maxsize=4096)
+def parse_docstring_text(doc):
+    """Parses the sections of a numpy-style docstring, given as text.
+
+    Results are cached by the text of the docstring, so objects that
+    share a docstring (ex: inherited or re-exported objects) are only
+    parsed once per process. The returned sections must not be changed.
+
+    Parameters
+    ----------
+    doc : str or None
+        The docstring of an object.
 
     Returns
     -------
@@ -320,8 +408,8 @@ def parse_docstring(obj):
         each of the section titles, as determined by numpy formatting.
     """
 
-    if obj.__doc__:
-        doc_str = obj.__doc__.strip().split('\n')
+    if doc:
+        doc_str = doc.strip().split('\n')
     
         if doc_str == ['']:
             return {'Summary': 'Not Documented.'}
@@ -398,29 +486,80 @@ def parse_docstring(obj):
 
             return sections
         else:
-            return{'Summary': obj.__doc__}
+            return{'Summary': doc}
     else:
         return {'Summary': 'Not Documented.'}
 
+def parse_docstring(obj):
+    """Parses the sections of a numpy-style docstring.
 
-def write_documentation_for_objs(objs, filename, include_toc=True):
-    """Writes documentation to a file.
+    For more on writing numpy-style docstrings read their documentation
+    at https://numpydoc.readthedocs.io/en/latest/format.html
+
+    Parameters
+    ----------
+    obj : Python object
+        An object, such as a method or a class, that has a docstring in
+        numpy-style.
+
+    Returns
+    -------
+    dict
+        The sections of the docstring with a key for 'Summary' and for
+        each of the section titles, as determined by numpy formatting.
+    """
+
+    sections = parse_docstring_text(obj.__doc__)
+    # the parsed sections are cached and shared, so hand out copies that can be changed
+    return {key: [list(row) for row in value] if isinstance(value, list) else value for key, value in sections.items()}
+
+
+def render_documentation_for_objs(objs, include_toc=True):
+    """Renders the documentation for objects as a markdown string.
 
     Parameters
     ----------
     objs : iterable of objects
-        A list of objects to write documentation for
-    filename : str or path-like
-        The filename to write to, ending in '.md'.
+        A list of objects to render documentation for.
     include_toc : bool, optional
         Whether or not to include a table of contents at the beginning
         of the document. Default is True.
+
+    Returns
+    -------
+    str
+        The documentation of all of the objects formatted for markdown.
+    """
+
+    documentation, titles = get_objs_markdown(objs, include_toc)
+    return documentation + format_links(link_headings(documentation, titles))
+
+def get_objs_markdown(objs, include_toc=True):
+    """Gets the documentation for objects and the headings to link to.
+
+    Parameters
+    ----------
+    objs : iterable of objects
+        A list of objects to render documentation for.
+    include_toc : bool, optional
+        Whether or not to include a table of contents at the beginning
+        of the document. Default is True.
+
+    Returns
+    -------
+    str
+        The documentation of all of the objects formatted for markdown,
+        without the markdown link definitions.
+    list
+        Tuples of the name of every object and class method and the
+        text of its heading, in the order they appear in the
+        documentation.
     """
 
     documentation = ''
     classes = []
     functions = []
-    links = {}
+    titles = []
     #TODO: add support for generators
 
     for obj in objs:
@@ -430,21 +569,17 @@ def write_documentation_for_objs(objs, filename, include_toc=True):
             classes.append(obj)
 
     for obj in functions:
-        obj_doc, obj_links = get_obj_documentation(obj)
+        obj_doc, obj_titles = get_obj_markdown(obj)
 
         documentation += obj_doc
-        links.update(obj_links)
+        titles += obj_titles
 
     for obj in classes:
-        obj_doc, obj_links = get_obj_documentation(obj)
+        obj_doc, obj_titles = get_obj_markdown(obj)
 
         documentation += '---\n\n'
         documentation += obj_doc
-        links.update(obj_links)
-
-    documentation += '<!-- Links -->\n'
-    for k,v in links.items():
-        documentation += f'[{k}]: #{v}\n'
+        titles += obj_titles
 
     if include_toc:
         toc = ''
@@ -463,8 +598,41 @@ def write_documentation_for_objs(objs, filename, include_toc=True):
 
         documentation = toc + documentation
 
+    return documentation, titles
+
+def format_links(links):
+    """Formats the markdown link definitions at the end of a page.
+
+    Parameters
+    ----------
+    links : dict
+        A dictionary where the key is the name of an object and the
+        value is the markdown link to its documentation.
+
+    Returns
+    -------
+    str
+        The link definitions as a markdown string.
+    """
+
+    return '<!-- Links -->\n' + ''.join(f'[{k}]: #{v}\n' for k,v in links.items())
+
+def write_documentation_for_objs(objs, filename, include_toc=True):
+    """Writes documentation to a file.
+
+    Parameters
+    ----------
+    objs : iterable of objects
+        A list of objects to write documentation for
+    filename : str or path-like
+        The filename to write to, ending in '.md'.
+    include_toc : bool, optional
+        Whether or not to include a table of contents at the beginning
+        of the document. Default is True.
+    """
+
     with open(filename, 'w') as f:
-        f.write(documentation)
+        f.write(render_documentation_for_objs(objs, include_toc))
 
 if False:
     pass
@@ -532,33 +700,42 @@ if False:
     #                 if len(nested_subpackages) >= 1:
     #                     [write_subpackage_documentation(subpkg_dir,exclude,subpkg_name) for nested_subpkg in nested_subpackages]
 
-def write_package_documentation(package_dir='', parent_package=None, write_subpkgs=True, exclude=[]):
-    """Writes the documentation for a package and any subpackages.
+def render_package_page(package_dir='', parent_package=None, include_subpkg_toc=True, exclude=[]):
+    """Renders the documentation page for a single package.
+
+    Subpackages are only listed in the table of contents; their own
+    pages are not rendered.
 
     Parameters
     ----------
     package_dir : str or path-like, optional
-        The path to the main package directory. If not given, will
-        default to the directory that this function is in. Default is
-        None.
+        The path to the package directory. If not given, will default
+        to the directory that this function is in. Default is None.
     parent_package : str, optional
         If the package in `package_dir` is a subdirectory, the name of
         the main package it is part of. Default is None.
-    write_subpkgs : bool, optional
-        Whether or not to write documentation for every subpackage.
+    include_subpkg_toc : bool, optional
+        Whether or not to include a table of contents of subpackages.
         Default is True.
     exclude : list, optional
-        A list of strings of subpackage names to not write documentation
-        for. Only relevant if `write_subpkgs` is True. Default is None.
+        A list of strings of subpackage names to not add to the table
+        of contents. Default is None.
+
+    Returns
+    -------
+    str
+        The full name of the package.
+    str
+        The filename the page belongs at.
+    str
+        The documentation of the page as a markdown string.
     """
 
     if package_dir == '':
         package_dir = split(__file__)[0]
 
     docs_dir = get_docs_directory(package_dir, parent_package)
-    if not exists(docs_dir):
-        makedirs(docs_dir)
-    
+
     pkg = basename(abspath(package_dir))
     title = f'# {pkg} Documentation\n'
     navbar = ''
@@ -572,30 +749,371 @@ def write_package_documentation(package_dir='', parent_package=None, write_subpk
 
     doc_fname = join(docs_dir, f"{pkg.replace('.','-')}.md")
 
-    print(f'Writing documentation for {pkg} ...')
-    write_documentation_for_objs(get_public_objects(pkg), doc_fname)
-
-    with open(doc_fname, 'r') as fo:
-        documentation = fo.read()
-
     pkg_docstring = import_module(pkg).__doc__
     if pkg_docstring is None:
         pkg_docstring = ''
 
-    if write_subpkgs:
+    if include_subpkg_toc:
         subpackage_toc = get_subpackage_toc(package_dir, pkg, exclude)
     else:
         subpackage_toc = ''
 
-    with open(doc_fname, 'w') as f:
-        f.write(title)
-        f.write(navbar)
-        f.write(pkg_docstring + '\n')
-        f.write(subpackage_toc)
-        f.write(documentation)
-
-    if write_subpkgs:
-        for subpkg in get_subpackages(package_dir):
-            if subpkg not in exclude:
-                subpackage_dir = join(package_dir, subpkg)
-                write_package_documentation(subpackage_dir, pkg, write_subpkgs, exclude)
+    documentation, titles = get_objs_markdown(get_public_objects(pkg))
+    # number repeated headings over the whole page, including the package docstring
+    documentation = title + navbar + pkg_docstring + '\n' + subpackage_toc + documentation
+
+    return pkg, doc_fname, documentation + format_links(link_headings(documentation, titles))
+
+def read_page_timings(docs_dir):
+    """Reads the timings of every page from the previous run.
+
+    Parameters
+    ----------
+    docs_dir : str or path-like
+        The path to the `/docs` directory.
+
+    Returns
+    -------
+    dict
+        A dictionary where the key is the page filename and the value
+        is a dictionary of the seconds spent to 'import' and 'render'
+        the page. If there are no timings, the dictionary will be empty.
+    """
+
+    timings_fname = join(docs_dir, TIMINGS_FILENAME)
+    if not exists(timings_fname):
+        return {}
+
+    try:
+        with open(timings_fname, 'r') as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+
+def write_page_timings(docs_dir, timings):
+    """Writes the timings of every page for the next run to use.
+
+    Parameters
+    ----------
+    docs_dir : str or path-like
+        The path to the `/docs` directory.
+    timings : dict
+        A dictionary where the key is the page filename and the value
+        is a dictionary of the seconds spent to 'import' and 'render'
+        the page.
+    """
+
+    with open(join(docs_dir, TIMINGS_FILENAME), 'w') as f:
+        json.dump(timings, f, indent=1, sort_keys=True)
+
+def get_predicted_cost(page, timings):
+    """Gets the predicted number of seconds to import and render a page.
+
+    Parameters
+    ----------
+    page : str
+        The page filename.
+    timings : dict
+        The timings of every page from the previous run.
+
+    Returns
+    -------
+    float
+        The predicted cost in seconds. Pages without a previous timing
+        are predicted to be infinitely expensive so that they are
+        scheduled first.
+    """
+
+    if page not in timings:
+        return float('inf')
+    return timings[page].get('import', 0) + timings[page].get('render', 0)
+
+def schedule_package_pages(package_dir, parent_package=None, write_subpkgs=True, exclude=[], timings={}):
+    """Orders the pages of a package so the most expensive are processed first.
+
+    Starting the long-running pages first keeps a few stragglers from
+    setting the wall-clock time when pages are processed concurrently.
+    The order is the same for serial runs.
+
+    Parameters
+    ----------
+    package_dir : str or path-like
+        The path to the main package directory.
+    parent_package : str, optional
+        If the package in `package_dir` is a subdirectory, the name of
+        the main package it is part of. Default is None.
+    write_subpkgs : bool, optional
+        Whether or not to include every subpackage. Default is True.
+    exclude : list, optional
+        A list of strings of subpackage names to leave out. Only
+        relevant if `write_subpkgs` is True. Default is None.
+    timings : dict, optional
+        The timings of every page from the previous run. If not given,
+        the pages will be in the order they are found in.
+
+    Returns
+    -------
+    list
+        Tuples of the page filename, the package directory, and its
+        parent package name, most expensive first.
+    """
+
+    index = get_page_index(package_dir, parent_package, exclude)
+    if not write_subpkgs:
+        index = dict(islice(index.items(), 1))
+
+    pages = [(page, pkg_dir, parent) for page, (pkg_dir, parent) in index.items()]
+    if timings:
+        pages.sort(key=lambda page: get_predicted_cost(page[0], timings), reverse=True)
+
+    return pages
+
+def format_timing_report(predicted, actual, top=10, cached=0):
+    """Formats a report of the predicted versus actual time of each page.
+
+    Parameters
+    ----------
+    predicted : dict
+        The timings of every page from the previous run.
+    actual : dict
+        The timings of every page rendered in this run.
+    top : int, optional
+        The number of most expensive pages to list. Default is 10.
+    cached : int, optional
+        The number of pages taken from a page cache instead of rendered,
+        which have no actual time. Default is 0.
+
+    Returns
+    -------
+    str
+        The report, ending in a newline.
+    """
+
+    def total(timing):
+        return timing.get('import', 0) + timing.get('render', 0)
+
+    predicted_total = sum(total(predicted[page]) for page in actual if page in predicted)
+    actual_total = sum(total(timing) for timing in actual.values())
+
+    report = f'\nPredicted {predicted_total:.3f}s, actual {actual_total:.3f}s for {len(actual)} pages\n'
+    if cached:
+        report += f'  {cached} pages were taken from the cache and are not timed\n'
+    for page in sorted(actual, key=lambda page: total(actual[page]), reverse=True)[:top]:
+        expected = f'{total(predicted[page]):.3f}s' if page in predicted else 'unknown'
+        report += (f"  {page}: predicted {expected}, actual {total(actual[page]):.3f}s "
+                   f"(import {actual[page]['import']:.3f}s, render {actual[page]['render']:.3f}s)\n")
+
+    return report
+
+def import_package(package, import_costs):
+    """Imports a package and times the first import of it and its parents.
+
+    Parameters
+    ----------
+    package : str
+        The full name of the package, with subpackages separated by
+        periods ".".
+    import_costs : dict
+        The seconds spent on the first import of each package in this
+        process, where the key is the full name of the package. Updated
+        in place; packages that were already imported are not added.
+    """
+
+    parts = package.split('.')
+    for i in range(1, len(parts)+1):
+        name = '.'.join(parts[:i])
+        if name not in sys.modules:
+            start = perf_counter()
+            import_module(name)
+            import_costs[name] = perf_counter() - start
+
+def render_package_documentation(package_dir='', parent_package=None, write_subpkgs=True, exclude=[], page_cache=None,
+                                 timings=None):
+    """Renders the documentation for a package and any subpackages.
+
+    Nothing is written to disk; every page is rendered in memory and
+    yielded as soon as it is ready, so callers can stop early.
+
+    Parameters
+    ----------
+    package_dir : str or path-like, optional
+        The path to the main package directory. If not given, will
+        default to the directory that this function is in. Default is
+        None.
+    parent_package : str, optional
+        If the package in `package_dir` is a subdirectory, the name of
+        the main package it is part of. Default is None.
+    write_subpkgs : bool, optional
+        Whether or not to render documentation for every subpackage.
+        Default is True.
+    exclude : list, optional
+        A list of strings of subpackage names to not render
+        documentation for. Only relevant if `write_subpkgs` is True.
+        Default is None.
+    page_cache : PageCache, optional
+        A cache of rendered pages to reuse. Pages whose source files
+        have not changed are not rendered again. Default is None.
+    timings : dict, optional
+        The timings of every page from the previous run, used to render
+        the most expensive pages first. Updated in place with the costs
+        measured in this run; imports that were already done and pages
+        taken from `page_cache` keep their previous costs. Default is
+        None.
+
+    Yields
+    ------
+    tuple of (str, str, str)
+        The package name, the filename the page belongs at, and the
+        documentation of the page as a markdown string.
+    """
+
+    if package_dir == '':
+        package_dir = split(__file__)[0]
+
+    if page_cache is not None:
+        # packages imported by an earlier run may have changed; import them again before timing imports
+        page_cache.unload_changed_modules()
+
+    import_costs = {}
+    for page, pkg_dir, parent in schedule_package_pages(package_dir, parent_package, write_subpkgs, exclude, timings or {}):
+        pkg = basename(abspath(pkg_dir)) if parent is None else f'{parent}.{basename(abspath(pkg_dir))}'
+
+        # the table of contents imports every subpackage, so time their imports separately from rendering
+        import_package(pkg, import_costs)
+        if write_subpkgs:
+            for subpkg in get_subpackages(pkg_dir):
+                if subpkg not in exclude:
+                    import_package(f'{pkg}.{subpkg}', import_costs)
+
+        renders = getattr(page_cache, 'renders', None)
+        start = perf_counter()
+        if page_cache is None:
+            pkg, doc_fname, documentation = render_package_page(pkg_dir, parent, write_subpkgs, exclude)
+        else:
+            pkg, doc_fname, documentation = page_cache.get(pkg_dir, parent, write_subpkgs, exclude)
+        rendered = perf_counter()
+
+        if timings is not None:
+            # only replace the costs that were measured; warm imports and cached pages keep the old ones
+            timing = {'import': 0.0, 'render': 0.0, **timings.get(page, {})}
+            if pkg in import_costs:
+                timing['import'] = import_costs[pkg]
+            if page_cache is None or page_cache.renders != renders:
+                timing['render'] = rendered - start
+            timings[page] = timing
+
+        yield pkg, doc_fname, documentation
+
+def write_package_documentation(package_dir='', parent_package=None, write_subpkgs=True, exclude=[], page_cache=None,
+                                timing_report=False):
+    """Writes the documentation for a package and any subpackages.
+
+    The time spent on every page is saved in the `/docs` directory and
+    used to process the most expensive pages first on the next run.
+
+    Parameters
+    ----------
+    package_dir : str or path-like, optional
+        The path to the main package directory. If not given, will
+        default to the directory that this function is in. Default is
+        None.
+    parent_package : str, optional
+        If the package in `package_dir` is a subdirectory, the name of
+        the main package it is part of. Default is None.
+    write_subpkgs : bool, optional
+        Whether or not to write documentation for every subpackage.
+        Default is True.
+    exclude : list, optional
+        A list of strings of subpackage names to not write documentation
+        for. Only relevant if `write_subpkgs` is True. Default is None.
+    page_cache : PageCache, optional
+        A cache of rendered pages to reuse. Pages whose source files
+        have not changed are not rendered again and keep their previous
+        timings. Default is None.
+    timing_report : bool, optional
+        Whether or not to print the predicted versus actual time of the
+        most expensive pages. Pages taken from `page_cache` are left
+        out. Default is False.
+    """
+
+    if package_dir == '':
+        package_dir = split(__file__)[0]
+
+    docs_dir = get_docs_directory(package_dir, parent_package)
+    if not exists(docs_dir):
+        makedirs(docs_dir)
+
+    predicted = read_page_timings(docs_dir)
+    timings = dict(predicted)
+    actual = {}
+    cached = 0
+
+    renders = getattr(page_cache, 'renders', None)
+    for pkg, doc_fname, documentation in render_package_documentation(package_dir, parent_package, write_subpkgs,
+                                                                    exclude, page_cache, timings):
+        print(f'Writing documentation for {pkg} ...')
+        with open(doc_fname, 'w') as f:
+            f.write(documentation)
+
+        # a cached page keeps its previous costs, which were not measured in this run
+        if page_cache is None or page_cache.renders != renders:
+            actual[basename(doc_fname)] = timings[basename(doc_fname)]
+        else:
+            cached += 1
+        renders = getattr(page_cache, 'renders', None)
+
+    write_page_timings(docs_dir, timings)
+
+    if timing_report:
+        print(format_timing_report(predicted, actual, cached=cached), end='')
+
+def check_package_documentation(package_dir='', exclude=[], fail_fast=False, page_cache=None):
+    """Checks that the written documentation for a package is current.
+
+    Every page is rendered in memory and compared by hash with the file
+    already in the `/docs` directory, most expensive first according to
+    the timings of the last written run. Nothing is written to disk.
+
+    Parameters
+    ----------
+    package_dir : str or path-like, optional
+        The path to the main package directory. If not given, will
+        default to the directory that this function is in. Default is
+        None.
+    exclude : list, optional
+        A list of strings of subpackage names to not check documentation
+        for. Default is None.
+    fail_fast : bool, optional
+        Whether or not to stop at the first stale or missing page.
+        Default is False.
+    page_cache : PageCache, optional
+        A cache of rendered pages to reuse. Pages whose source files
+        have not changed are not rendered again. Default is None.
+
+    Returns
+    -------
+    list
+        The filenames of every page that is stale or missing. If the
+        documentation is current, the list will be empty.
+    """
+
+    if package_dir == '':
+        package_dir = split(__file__)[0]
+
+    timings = read_page_timings(get_docs_directory(package_dir))
+
+    stale = []
+    for pkg, doc_fname, documentation in render_package_documentation(package_dir, exclude=exclude, page_cache=page_cache,
+                                                                    timings=dict(timings)):
+        if not exists(doc_fname):
+            stale.append(normpath(doc_fname))
+        else:
+            with open(doc_fname, 'r') as f:
+                current_hash = sha256(f.read().encode()).digest()
+            if current_hash != sha256(documentation.encode()).digest():
+                stale.append(normpath(doc_fname))
+
+        if fail_fast and stale:
+            break
+
+    return stale
@@ -4,8 +4,15 @@ This module contains functions that formats Python objects and
 properties to Markdown.
 """
 
+import re
 from string import punctuation
 
+# Github keeps letters, numbers, underscores, and hyphens; spaces become hyphens
+LINK_TRANSLATION = str.maketrans({**{punc: None for punc in punctuation if punc not in '_-'},
+                                  '\n': None, ' ': '-'})
+HEADING = re.compile(r'#{1,6} ')
+CODE_SPAN = re.compile(r'(`+).+?(?<!`)\1(?!`)')
+
 
 def generate_markdown_table(headers, *args, italicize_optional=True):
     """Generates a table in markdown.
@@ -37,13 +44,45 @@ def generate_markdown_table(headers, *args, italicize_optional=True):
     
     return f'{header}{hyphens}{data}'
 
-def convert_to_markdown_link(string):
+def make_markdown_link_unique(link, anchors):
+    """Makes a markdown link unique on its page the same way Github does.
+
+    The first use of a link is unchanged and every later use gets a
+    `-1`, `-2`, ... suffix.
+
+    Parameters
+    ----------
+    link : str
+        The markdown link.
+    anchors : dict
+        The number of times each link has been used on the page. Updated
+        in place.
+
+    Returns
+    -------
+    str
+        The unique markdown link.
+    """
+
+    unique_link = link
+    while unique_link in anchors:
+        anchors[link] += 1
+        unique_link = f'{link}-{anchors[link]}'
+    anchors[unique_link] = 0
+
+    return unique_link
+
+def convert_to_markdown_link(string, anchors=None):
     """Converts a string to an acceptable markdown link.
 
     Parameters
     ----------
     string : str
         The string to convert.
+    anchors : dict, optional
+        The number of times each link has been used on the page. If
+        given, repeated links get Github-style `-1`, `-2` suffixes and
+        `anchors` is updated in place. Default is None.
 
     Returns
     -------
@@ -51,8 +90,167 @@ def convert_to_markdown_link(string):
         The string formatted to be a markdown link.
     """
 
-    for punc in punctuation:
-        if punc != '_':
-            string = string.replace(punc, '')
-    string = string.replace(' ', '-').replace('\n', '')
-    return string.lower()
\ No newline at end of file
+    link = string.translate(LINK_TRANSLATION).lower()
+    if anchors is not None:
+        link = make_markdown_link_unique(link, anchors)
+    return link
+
+def convert_to_markdown_links(strings, anchors=None):
+    """Converts a batch of strings to acceptable markdown links.
+
+    All of the strings are translated in a single pass, which is much
+    faster than converting them one at a time.
+
+    Parameters
+    ----------
+    strings : iterable of str
+        The strings to convert, in the order they appear on the page.
+    anchors : dict, optional
+        The number of times each link has been used on the page. If
+        given, repeated links get Github-style `-1`, `-2` suffixes and
+        `anchors` is updated in place. Default is None.
+
+    Returns
+    -------
+    list
+        The strings formatted to be markdown links.
+    """
+
+    strings = list(strings)
+    if not strings:
+        return []
+
+    links = '\0'.join(strings).translate(LINK_TRANSLATION).lower().split('\0')
+    if anchors is not None:
+        links = [make_markdown_link_unique(link, anchors) for link in links]
+    return links
+
+def get_headings(documentation):
+    """Gets the text of every heading in a markdown document.
+
+    Lines inside of fenced code blocks are not headings.
+
+    Parameters
+    ----------
+    documentation : str
+        The markdown document.
+
+    Returns
+    -------
+    list
+        The text of the headings without the leading `#`, in order.
+    """
+
+    headings = []
+    in_code = False
+    for line in documentation.split('\n'):
+        if line.startswith('```'):
+            in_code = not in_code
+        elif not in_code and HEADING.match(line):
+            headings.append(line.lstrip('#').strip())
+
+    return headings
+
+def get_heading_anchors(documentation, anchors=None):
+    """Gets the markdown link of every heading in a markdown document.
+
+    Lines inside of fenced code blocks are not headings.
+
+    Parameters
+    ----------
+    documentation : str
+        The markdown document.
+    anchors : dict, optional
+        The number of times each link has already been used earlier on
+        the page. Updated in place. Default is None.
+
+    Returns
+    -------
+    list
+        The markdown links of the headings, in order.
+    """
+
+    if anchors is None:
+        anchors = {}
+
+    return convert_to_markdown_links(get_headings(documentation), anchors)
+
+def link_headings(documentation, titles):
+    """Gets the markdown links of specific headings in a markdown document.
+
+    Every heading of the document is converted in a single pass, so
+    repeated headings are numbered the same way Github numbers them.
+
+    Parameters
+    ----------
+    documentation : str
+        The whole markdown document.
+    titles : iterable of tuple
+        Tuples of a name and the text of its heading, in the order the
+        headings appear in the document. A name that appears more than
+        once links to its first heading.
+
+    Returns
+    -------
+    dict
+        A dictionary where the key is the name and the value is the
+        markdown link to its heading.
+    """
+
+    headings = get_headings(documentation)
+    anchors = convert_to_markdown_links(headings, {})
+
+    links = {}
+    i = 0
+    for name, title in titles:
+        while i < len(headings) and headings[i] != title:
+            i += 1
+        if i == len(headings):
+            break
+        links.setdefault(name, anchors[i])
+        i += 1
+
+    return links
+
+def sub_outside_code(pattern, repl, documentation, headings=True):
+    """Replaces the matches of a regular expression outside of code.
+
+    Fenced code blocks and doctest lines starting with `>>>` or `...`
+    are never changed. An inline code span is only replaced if the
+    pattern matches all of it.
+
+    Parameters
+    ----------
+    pattern : re.Pattern
+        The compiled regular expression.
+    repl : str or callable
+        The replacement, as for `re.Pattern.sub`.
+    documentation : str
+        The markdown document.
+    headings : bool, optional
+        Whether or not to replace matches in headings. Default is True.
+
+    Returns
+    -------
+    str
+        The markdown document with the matches outside of code replaced.
+    """
+
+    lines = documentation.split('\n')
+    in_code = False
+    for i, line in enumerate(lines):
+        if line.startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code or line.lstrip().startswith(('>>>', '...')) or (not headings and HEADING.match(line)):
+            continue
+
+        text = ''
+        end = 0
+        for span in CODE_SPAN.finditer(line):
+            text += pattern.sub(repl, line[end:span.start()])
+            text += pattern.sub(repl, span.group(0)) if pattern.fullmatch(span.group(0)) else span.group(0)
+            end = span.end()
+        lines[i] = text + pattern.sub(repl, line[end:])
+
+    return '\n'.join(lines)
@@ -0,0 +1,69 @@
+"""server.py
+
+This module contains a local HTTP server that previews documentation by
+rendering package pages only when they are requested.
+"""
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from os.path import abspath, basename
+
+from cache import PageCache
+from documentation import get_page_index
+
+
+def serve_package_documentation(package_dir, host='localhost', port=8000, cache_size=128, exclude=[]):
+    """Serves a package's documentation from a local HTTP server.
+
+    Each page is rendered the first time it is requested and cached
+    until its source files change.
+
+    Parameters
+    ----------
+    package_dir : str or path-like
+        The path to the main package directory.
+    host : str, optional
+        The address to listen on. Default is 'localhost'.
+    port : int, optional
+        The port to listen on. Default is 8000.
+    cache_size : int, optional
+        The maximum number of rendered pages kept in memory. Default is
+        128.
+    exclude : list, optional
+        A list of strings of subpackage names to not serve documentation
+        for. Default is None.
+    """
+
+    cache = PageCache(cache_size)
+    index = get_page_index(package_dir, exclude=exclude)
+    root_page = next(iter(index))
+
+    class DocumentationRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            nonlocal index
+
+            page = self.path.split('?')[0].split('#')[0].lstrip('/') or root_page
+            if page not in index:
+                index = get_page_index(package_dir, exclude=exclude)
+            if page not in index:
+                self.send_error(404, f'No documentation page named {page}')
+                return
+
+            try:
+                cache.unload_changed_modules()
+                documentation = cache.get(*index[page], exclude=exclude)[2].encode()
+            except Exception as e:
+                self.send_error(500, f'Could not render {page}', f'{type(e).__name__}: {e}')
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(len(documentation)))
+            self.end_headers()
+            self.wfile.write(documentation)
+
+    with HTTPServer((host, port), DocumentationRequestHandler) as server:
+        print(f'Serving documentation for {basename(abspath(package_dir))} at http://{host}:{port}/{root_page}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass